@@ -1,9 +1,10 @@
-from ao3.services.archiveWorks import ArchiveWork as Work
+from ao3.services.archiveWorks import ArchiveWork as Work, WorkStatsTable
 from ao3.services.archiveUser import ArchiveUser as User
 from ao3.services.archiveSearch import ArchiveSearch as Search
 
 __all__ = [
     "Work",
+    "WorkStatsTable",
     "User",
     "Search",
 ]
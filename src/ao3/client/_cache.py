@@ -0,0 +1,116 @@
+"""
+Module providing an on-disk cache for pages fetched from OTW servers.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+from urllib.parse import urlencode
+
+__all__ = ["ResponseCache"]
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of page texts, keyed on the URL and query parameters they were fetched with.
+
+    Args:
+        path (str | os.PathLike): The path of the SQLite database. Defaults to "ao3_cache.sqlite".
+        expire_after (float): How long an entry stays valid, in seconds. Defaults to an hour.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike = "ao3_cache.sqlite",
+        expire_after: float = 3600,
+    ) -> None:
+        self.expire_after = expire_after
+        """How long an entry stays valid, in seconds."""
+
+        # The connection is shared by the threads of `ClientSession.fetch_many`, so access is serialized by a lock.
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, text TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)"
+            )
+            self._purge()
+
+    @staticmethod
+    def _key(url: str, params: Optional[dict[str, Any]]) -> str:
+        """
+        Builds the cache key for the given URL and parameters.
+        Parameters are sorted, so the same query always maps to the same key.
+        """
+        return (
+            f"{url}?{urlencode(sorted(params.items()), doseq=True)}" if params else url
+        )
+
+    def _purge(self) -> None:
+        """
+        Deletes the expired entries, which would otherwise only be replaced if their page was fetched again.
+        Must be called within a transaction on the connection.
+        """
+        self._connection.execute(
+            "DELETE FROM responses WHERE stored_at < ?",
+            (time.time() - self.expire_after,),
+        )
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        Returns the cached text for the given URL and parameters.
+
+        Args:
+            url (str): The URL the page was fetched from.
+            params (Optional[dict[str, Any]]): The parameters the page was fetched with.
+
+        Returns:
+            Optional[str]: The cached text, or None if there is no valid entry.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT text, stored_at FROM responses WHERE key = ?",
+                (self._key(url, params),),
+            ).fetchone()
+
+        # Wall-clock time, since entries outlive the process that stored them.
+        if row is None or time.time() - row[1] > self.expire_after:
+            return None
+        return row[0]
+
+    def set(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]],
+        text: str,
+    ) -> None:
+        """
+        Stores the text of a page fetched from the given URL and parameters.
+
+        Args:
+            url (str): The URL the page was fetched from.
+            params (Optional[dict[str, Any]]): The parameters the page was fetched with.
+            text (str): The text of the page.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, text, stored_at) VALUES (?, ?, ?)",
+                (self._key(url, params), text, time.time()),
+            )
+            self._purge()
+
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
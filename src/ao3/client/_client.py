@@ -4,14 +4,20 @@ Module responsible for communicating with OTW servers.
 
 from __future__ import annotations
 
-from typing import Any, Optional, TypeVar, ParamSpec
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Optional, TypeVar, ParamSpec
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 from cloudscraper import CloudScraper
+from lxml import etree
 from requests import Response, packages
+from urllib3.util import Retry
 
-from ao3.client._throttle import throttle_dispatch
+from ao3.client._cache import ResponseCache
+from ao3.client._throttle import Throttle, ThrottledAdapter
 
 # This disables IPV6.
 # Since ArchiveOfOurOwn does not support IPv6, and `requests.Session` uses it by default,
@@ -22,6 +28,15 @@ packages.urllib3.util.connection.HAS_IPV6 = False
 
 __all__ = ["ClientSession"]
 
+# Compiled once, so checking a page that isn't returned as soup never goes through BeautifulSoup.
+_XP_SIGNIN = etree.XPath("boolean(//div[@id='signin'])")
+_XP_HEADING = etree.XPath(
+    "string((//h2[contains(concat(' ', normalize-space(@class), ' '), ' heading ')])[1])"
+)
+
+_THROTTLE = Throttle(1.0)
+"""Paces the requests of every `ClientSession` (subclasses and separate instances alike), keeping the pace process-wide."""
+
 
 class ArchiveError(Exception):
     """
@@ -47,6 +62,14 @@ class ArchivePageNotFoundError(ArchiveError):
     pass
 
 
+class ArchiveResponseError(ArchiveError):
+    """
+    Raised when the server responds with an error status (e.g. `429` once retries are exhausted).
+    """
+
+    pass
+
+
 class ClientSession:
     """
     Base class for interacting with OTW.
@@ -55,62 +78,139 @@ class ClientSession:
 
     BASE_URL = "https://archiveofourown.org/"
     """Base URL for Archive Of Our Own."""
+    _HOST_URL = BASE_URL.rstrip("/")
+    """`BASE_URL` without its trailing slash, which root-relative paths are appended to."""
     _INSTANCE: Optional[ClientSession] = None
     """Singleton instance of the class."""
-
-    def __new__(cls, *args, **kwargs) -> ClientSession:
-        """
-        Singleton implementation for the `ClientSession` class.
-        This ensures that only one instance of the class is commonly shared across the library,
-        that the requester doesn't get blocked by the website, and that authenticated credentials are shared.
-        """
-        # TODO: Consider raising an Exception if the user tries to create a new instance.
-        # Reasoning being that, given the object (private as it may be) is not explicitly stated as a singleton,
-        # The user may not be aware, and therefore be lied to about the object's nature.
-
-        if cls._INSTANCE is None or not isinstance(cls._INSTANCE, cls):
-            cls._INSTANCE = super().__new__(cls)
-
-        return cls._INSTANCE
+    _INSTANCE_LOCK = threading.Lock()
+    """Lock guarding the creation of the singleton instance."""
 
     def __init__(
         self,
     ) -> None:
-        # If there's already a session object, then an instance has already been created.
-        # Therefore, we return as to not rewrite the object.
-        if hasattr(self, "_session"):
-            return
-
         self._session = CloudScraper()
         """Session object for making requests to the website."""
+
+        # Every request goes to the same host, so keep connections alive and pooled
+        # rather than paying for a new TCP + TLS handshake on each call.
+        # Requests are paced by the adapter itself, so every request (redirects and Cloudflare challenges included)
+        # waits its turn, while those that never reach the network (e.g. cached pages) aren't held back.
+        # The adapter carries over the cipher suite `CloudScraper` needs to get past Cloudflare.
+        # Retries honor the `Retry-After` header AO3 sends along with `429` responses, and are paced like any other request.
+        # `503` is left out, as it's the status Cloudflare serves its challenges with, which `CloudScraper` solves itself.
+        adapter = ThrottledAdapter(
+            _THROTTLE,
+            Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 504),
+                respect_retry_after_header=True,
+            ),
+            cipherSuite=self._session.cipherSuite,
+            ecdhCurve=self._session.ecdhCurve,
+            server_hostname=self._session.server_hostname,
+            source_address=self._session.source_address,
+            ssl_context=self._session.ssl_context,
+            pool_connections=4,
+            pool_maxsize=32,
+        )
+        # Mounted for plain HTTP as well, so an `http://` URL shares the same pool and pace until it's redirected.
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({"Connection": "keep-alive"})
+
         self._is_authenticated = False
         """If the client has authenticated credentials."""
+        self._cache: Optional[ResponseCache] = None
+        """On-disk cache for fetched pages, if enabled."""
+
+    def enable_cache(
+        self,
+        path: str | os.PathLike = "ao3_cache.sqlite",
+        expire_after: float = 3600,
+    ) -> None:
+        """
+        Enables caching fetched pages on disk, so fetching them again skips the network (and the throttle) entirely.
+
+        Args:
+            path (str | os.PathLike): The path of the SQLite database. Defaults to "ao3_cache.sqlite".
+            expire_after (float): How long a cached page stays valid, in seconds. Defaults to an hour.
+        """
+        self._cache = ResponseCache(path, expire_after)
+
+    def disable_cache(self) -> None:
+        """
+        Disables the on-disk cache. Pages already cached are kept on disk.
+        """
+        self._cache = None
 
     @staticmethod
     def _assert_response_success(
-        response: Response | BeautifulSoup,
+        page: BeautifulSoup | etree._Element,
     ) -> None:
         """
         Asserts that the response is successful.
         If the response is not successful, raises an exception.
 
         Args:
-            response (Response | BeautifulSoup): The response object to check.
+            page (BeautifulSoup | etree._Element): The parsed response to check.
         """
-        if isinstance(response, Response):
-            response = BeautifulSoup(response.text, "lxml")
+        if isinstance(page, BeautifulSoup):
+            is_restricted = page.find("div", {"id": "signin"}) is not None
+            heading = page.find("h2", {"class": "heading"})
+            heading = heading.text if heading else ""
+        else:
+            is_restricted = _XP_SIGNIN(page)
+            heading = _XP_HEADING(page)
 
         # TODO: Implement more checks for different types of errors.
         # Albeit requests can successfully return `200`, the page can still contain an error message.
-        if response.find("div", {"id": "signin"}):
+        if is_restricted:
             raise ClientNotAuthorizedError(
                 f"Failed to fetch data; This page is restricted to registered users. \nUnfortunately, this library does not currently support logging."
             )
-        elif response.find("h2", {"class": "heading"}).text == "Error 404":
+        elif heading == "Error 404":
             raise ArchivePageNotFoundError(
                 f"Failed to fetch data; This page does not exist. \nTIP: Have you entered the correct URL?"
             )
 
+    def _handle_response(
+        self,
+        response: Response,
+        soup: bool,
+    ) -> BeautifulSoup | str:
+        """
+        Checks the response, and returns it in the requested form.
+
+        Args:
+            response (Response): The response to handle.
+            soup (bool): If the response should be parsed to a BeautifulSoup object.
+
+        Returns:
+            BeautifulSoup | str: The response text if `soup` is False, otherwise a BeautifulSoup object.
+        """
+        # Pages are served as UTF-8; setting it up front keeps `response.text` from guessing the charset.
+        response.encoding = response.encoding or "utf-8"
+
+        if soup:
+            # The page is parsed once, and the same tree is used both to check it and to return it.
+            page = BeautifulSoup(response.text, "lxml")
+            self._assert_response_success(page)
+        else:
+            # Only the text is wanted, so the check runs over a bare lxml tree instead.
+            # `etree.HTML` returns `None` for an empty body, which has nothing to check.
+            page = response.text
+            tree = etree.HTML(response.content)
+            if tree is not None:
+                self._assert_response_success(tree)
+
+        # Checked after the page itself, so e.g. a `404` still raises `ArchivePageNotFoundError`.
+        if not response.ok:
+            raise ArchiveResponseError(
+                f"Failed to fetch data; The server responded with {response.status_code} {response.reason}."
+            )
+        return page
+
     def _resolve_url(self, url: str) -> str:
         """
         Resolves the given URL to an absolute URL.
@@ -121,13 +221,14 @@ class ClientSession:
         Returns:
             str: The resolved URL.
         """
-        return (
-            url
-            if url.startswith(("http://", "https://"))
-            else urljoin(self.BASE_URL, url)
-        )
+        if url.startswith(("http://", "https://")):
+            return url
+        # Most URLs are root-relative paths (e.g. "/works/123"), which only need to be appended to the host;
+        # `urljoin` is left for the rest, including protocol-relative URLs ("//host/path").
+        if url.startswith("/") and not url.startswith("//"):
+            return self._HOST_URL + url
+        return urljoin(self.BASE_URL, url)
 
-    @throttle_dispatch(1.0)
     def fetch(
         self,
         url: str,
@@ -146,11 +247,59 @@ class ClientSession:
             BeautifulSoup | str: The response text if `soup` is False, otherwise a BeautifulSoup object.
         """
         url = self._resolve_url(url)
+
+        # Only pages that passed the checks in `_handle_response` are cached, so a hit is returned as is.
+        if self._cache is not None:
+            text = self._cache.get(url, params)
+            if text is not None:
+                return BeautifulSoup(text, "lxml") if soup else text
+
         response = self._session.get(url, params=params)
-        self._assert_response_success(response)
-        return response.text if not soup else BeautifulSoup(response.text, "lxml")
+        page = self._handle_response(response, soup)
+        if self._cache is not None and response.ok:
+            self._cache.set(url, params, response.text)
+        return page
+
+    def fetch_many(
+        self,
+        urls: Iterable[str],
+        soup: bool = False,
+        max_concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[BeautifulSoup | str | Exception]:
+        """
+        Fetches data from each of the given URLs, keeping up to `max_concurrency` requests in flight.
+
+        Requests are still admitted at the session's pace,
+        but one no longer has to wait for the previous response before being sent.
+
+        Concurrent requests share the session's `CloudScraper`, whose Cloudflare challenge solving isn't thread-safe:
+        if several of them are challenged at once, its loop protection may trip and raise `CloudflareLoopProtection`.
+        Concurrency is only safe once the Cloudflare clearance cookie is set (e.g. by a prior `fetch`),
+        or with `max_concurrency=1`.
+
+        Args:
+            urls (Iterable[str]): The URLs to fetch data from.
+            soup (bool): If the responses should be parsed to BeautifulSoup objects.
+            max_concurrency (int): The maximum number of requests in flight at once. Defaults to 4.
+            return_exceptions (bool): If an exception raised while fetching a URL should be returned in its place,
+                rather than raised (discarding the other responses). Defaults to False.
+
+        Returns:
+            list[BeautifulSoup | str | Exception]: The responses, in the same order as `urls`.
+        """
+
+        def fetch(url: str) -> BeautifulSoup | str | Exception:
+            try:
+                return self.fetch(url, soup=soup)
+            except Exception as error:
+                if not return_exceptions:
+                    raise
+                return error
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(fetch, urls))
 
-    @throttle_dispatch(1.0)
     def post(
         self,
         url: str,
@@ -170,15 +319,25 @@ class ClientSession:
         """
         url = self._resolve_url(url)
         response = self._session.post(url, data=data)
-        self._assert_response_success(response)
-        return response.text if not soup else BeautifulSoup(response.text, "lxml")
+        return self._handle_response(response, soup)
 
     @classmethod
     def instance(cls) -> ClientSession:
         """
         Returns the singleton instance of the class.
+        This ensures that only one instance of the class is commonly shared across the library,
+        that the requester doesn't get blocked by the website, and that authenticated credentials are shared.
+
+        Each subclass gets its own instance, rather than sharing (or overwriting) its parent's.
 
         Returns:
             ClientSession: The singleton instance of the class.
         """
-        return cls()
+        # Looked up in the class' own namespace, so a subclass doesn't pick up its parent's instance.
+        instance = cls.__dict__.get("_INSTANCE")
+        if instance is None:
+            with cls._INSTANCE_LOCK:
+                instance = cls.__dict__.get("_INSTANCE")
+                if instance is None:
+                    instance = cls._INSTANCE = cls()
+        return instance
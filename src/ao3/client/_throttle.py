@@ -1,78 +1,94 @@
 from __future__ import annotations
 
-import functools
-import queue
 import threading
 import time
-from typing import Callable, TypeVar, ParamSpec
+from typing import Any
 
-P = ParamSpec("P")
-R = TypeVar("R")
+from cloudscraper import CipherSuiteAdapter
+from requests import PreparedRequest, Response
+from urllib3.exceptions import MaxRetryError
+from urllib3.util import Retry
 
 
-def throttle_dispatch(interval: float) -> Callable[[Callable[P, R]], Callable[P, R]]:
+class Throttle:
     """
-    Decorator that throttles function calls with a minimum interval between each execution.
+    Paces callers so that at least `interval` seconds pass between each of them being let through.
+
+    Each caller reserves the next free slot under a lock, then sleeps outside of it until its slot comes up,
+    so waiters don't hold each other back any longer than the interval requires.
+
+    Args:
+        interval (float): The minimum interval between each caller.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        """The minimum interval between each caller."""
+        self._lock = threading.Lock()
+        self._next = 0.0
+        """The `time.monotonic` time at which the next caller may go through."""
+
+    def acquire(self) -> None:
+        """Blocks until the caller's slot comes up."""
+        with self._lock:
+            # `time.monotonic` rather than `time.time`, so wall-clock adjustments can't stall the caller.
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+
+        if start > now:
+            time.sleep(start - now)
+
+
+class ThrottledAdapter(CipherSuiteAdapter):
+    """
+    Transport adapter which paces every request it sends through a `Throttle`.
+
+    Built on `CloudScraper`'s adapter, so that its cipher suite (needed to get past Cloudflare) is kept.
+
+    Responses with a status in `retries.status_forcelist` are retried here rather than within urllib3,
+    so each retry waits for its own slot. Failed connections, which never reach the server,
+    are still retried by urllib3.
 
     Args:
-        interval (float): The minimum interval between each function call.
+        throttle (Throttle): The throttle pacing the requests.
+        retries (Retry): The retry policy, whose backoff (or `Retry-After` header) is waited on before each retry.
+        **kwargs: Forwarded to `CipherSuiteAdapter`.
     """
 
-    def decorator(func: Callable[P, R]) -> Callable[P, R]:
-        call_queue = queue.Queue()
-        lock = threading.Lock()
-        last_called = 0.0
-        processing = False
-
-        def process_queue() -> None:
-            nonlocal last_called, processing
-            with lock:
-                processing = True
-
-            while True:
-                try:
-                    args, kwargs, result_event, result_container = call_queue.get(
-                        block=False
-                    )
-
-                    elapsed = time.time() - last_called
-                    if elapsed < interval:
-                        time.sleep(interval - elapsed)
-
-                    try:
-                        last_called = time.time()
-                        result = func(*args, **kwargs)
-                        result_container[0] = (result, None)
-                    except Exception as e:
-                        result_container[0] = (None, e)
-
-                    result_event.set()
-                    call_queue.task_done()
-
-                except queue.Empty:
-                    with lock:
-                        if call_queue.empty():
-                            processing = False
-                            break
-
-        @functools.wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            result_event = threading.Event()
-            result_container = [None]
-
-            call_queue.put((args, kwargs, result_event, result_container))
-
-            with lock:
-                if not processing:
-                    thread = threading.Thread(target=process_queue, daemon=True)
-                    thread.start()
-
-            result_event.wait()
-            result, exception = result_container[0]
-            if exception:
-                raise exception
-            return result
-
-        return wrapper
-
-    return decorator
+    def __init__(self, throttle: Throttle, retries: Retry, **kwargs: Any) -> None:
+        self._throttle = throttle
+        self._retries = retries
+        super().__init__(
+            max_retries=retries.new(
+                read=False, status_forcelist=(), respect_retry_after_header=False
+            ),
+            **kwargs,
+        )
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        retries = self._retries
+        while True:
+            self._throttle.acquire()
+            response = super().send(request, **kwargs)
+            # Cloudflare challenges (marked by `cf-mitigated`, and possibly served as `429`) are left to `CloudScraper`.
+            if (
+                response.status_code not in retries.status_forcelist
+                or "cf-mitigated" in response.headers
+                or not retries.is_retry(request.method, response.status_code)
+            ):
+                return response
+
+            try:
+                retries = retries.increment(
+                    request.method, request.url, response=response.raw
+                )
+            except MaxRetryError:
+                # Out of retries; the last response is returned as is, and `ClientSession` raises for its status.
+                return response
+
+            # Honors the `Retry-After` header when present, and backs off otherwise.
+            retries.sleep(response.raw)
+            # Drained before being closed, so the connection goes back to the pool.
+            response.content
+            response.close()
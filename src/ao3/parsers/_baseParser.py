@@ -4,18 +4,38 @@ Base parser class for all parsers
 
 from __future__ import annotations
 
-from typing import Any
+import re
+from functools import cached_property
+from typing import Any, Iterator, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from soupsieve import SoupSieve
+
+_NON_DIGITS = re.compile(r"\D+")
+"""Matches everything `int` can't parse, e.g. the thousands separators in "1,234"."""
 
 
 class BaseParser:
+    STRAINER: Optional[SoupStrainer] = None
+    """If set, only the matching parts of a page given as text are parsed."""
+
     def __init__(
         self,
         page: str | BeautifulSoup,
     ) -> None:
-        self.soup = (
-            page if isinstance(page, BeautifulSoup) else BeautifulSoup(page, "lxml")
+        self._page = page
+
+    @cached_property
+    def _soup(self) -> BeautifulSoup:
+        """
+        The parsed page.
+        Built on first access, so a parser that's never read never pays for parsing its page.
+        """
+        page, self._page = self._page, None
+        return (
+            page
+            if isinstance(page, BeautifulSoup)
+            else BeautifulSoup(page, "lxml", parse_only=self.STRAINER)
         )
 
     def parse(self) -> dict[str, Any]:
@@ -23,22 +43,36 @@ class BaseParser:
             "The 'parse' method must be implemented by the subclass."
         )
 
-    def _get_text(self, selector: str, default: str = "") -> str:
-        element = self.soup.select_one(selector)
+    def _get_text(self, selector: str | SoupSieve, default: str = "") -> str:
+        element = self._soup.select_one(selector)
         return element.text.strip() if element else default
 
-    def _get_texts(self, selector: str, default: list[str] = []) -> list[str]:
-        elements = self.soup.select(selector)
-        return [element.text.strip() for element in elements] if elements else default
+    def _iter_texts(self, selector: str | SoupSieve) -> Iterator[str]:
+        # Stripped as they're consumed, so callers that only join or count them never build a list.
+        for element in self._soup.select(selector):
+            yield element.text.strip()
 
-    def _get_attribute(self, selector: str, attribute: str, default: str = "") -> str:
-        element = self.soup.select_one(selector)
-        return element.get(attribute) if element else default
+    def _get_texts(
+        self, selector: str | SoupSieve, default: Optional[list[str]] = None
+    ) -> list[str]:
+        texts = list(self._iter_texts(selector))
+        if texts:
+            return texts
+        # A fresh list each time, so a caller appending to the result can't alter the default.
+        return [] if default is None else default
+
+    def _get_attribute(
+        self, selector: str | SoupSieve, attribute: str, default: str = ""
+    ) -> str:
+        element = self._soup.select_one(selector)
+        return element.get(attribute, default) if element else default
 
     def _extract_count(self, text: str) -> int:
         if not text:
             return 0
-        try:
-            return int("".join(c for c in text if c.isdigit()))
-        except ValueError:
-            return 0
+        # Stats are almost always plain, comma-grouped numbers (e.g. "1,234"), which skip the regex entirely.
+        digits = text.replace(",", "")
+        if digits.isdecimal():
+            return int(digits)
+        digits = _NON_DIGITS.sub("", text)
+        return int(digits) if digits else 0
@@ -1,6 +1,36 @@
+import re
+import sys
+
 from ao3.parsers import Base
 from typing import List, Dict, Any, Tuple, Optional
 from datetime import datetime
+from functools import cached_property
+
+import soupsieve as sv
+from bs4 import SoupStrainer, Tag
+
+# Selectors are compiled once here rather than on each lookup.
+_SEL_META = sv.compile("dl.work.meta.group")
+_SEL_TITLE = sv.compile("h2.title")
+_SEL_AUTHORS = sv.compile("a[rel='author']")
+_SEL_SUMMARY = sv.compile("div.summary .userstuff")
+_SEL_SERIES_POSITION = sv.compile("dd.series span.position")
+_SEL_SERIES_LINK = sv.compile("dd.series a:not(.previous):not(.next)")
+
+_METADATA_SECTIONS = frozenset({"meta", "preface"})
+"""Classes of the blocks a work's metadata is read from."""
+_UNKNOWN_CHAPTER_COUNTS = frozenset({"?", "∞"})
+"""Expected chapter counts AO3 shows for works whose length isn't known yet."""
+
+
+def _is_metadata_section(classes: Optional[str]) -> bool:
+    """Match the blocks a work's metadata is read from: `dl.meta` (tags and stats) and `div.preface` (title, byline and summary)."""
+    # While parsing, the class attribute is given as a single, unsplit string.
+    return classes is not None and not _METADATA_SECTIONS.isdisjoint(classes.split())
+
+
+_RESTRICTED_RE = re.compile(r"restricted|explicit|mature|not rated", re.IGNORECASE)
+"""Matches the warnings that indicate a work's access is restricted."""
 
 
 class WorkParser(Base):
@@ -9,8 +39,12 @@ class WorkParser(Base):
     This parser extracts metadata from AO3 work/story pages.
     """
 
+    STRAINER = SoupStrainer(["dl", "div"], class_=_is_metadata_section)
+    """Only the metadata and preface blocks are parsed; the site's chrome and, above all, the chapters' text are skipped."""
+
     def parse(self) -> Dict[str, Any]:
         """Parse the work page and return structured data."""
+        warnings = self._fetch_warnings()
         return {
             "title": self._fetch_title(),
             "author": self._fetch_authors(),
@@ -32,109 +66,164 @@ class WorkParser(Base):
             "fandoms": self._fetch_fandoms(),
             "categories": self._fetch_categories(),
             "ratings": self._fetch_ratings(),
-            "warnings": self._fetch_warnings(),
+            "warnings": warnings,
             "series": self._fetch_series(),
-            "is_restricted": self._fetch_is_restricted(),
+            "is_restricted": self._fetch_is_restricted(warnings),
         }
 
+    @cached_property
+    def _meta(self) -> Optional[Tag]:
+        """The `dl.work.meta.group` block, holding the work's tags and stats."""
+        return self._soup.select_one(_SEL_META)
+
+    @cached_property
+    def _stats(self) -> Optional[Tag]:
+        """The `dl.stats` block, nested within the work's metadata."""
+        return self._meta.find("dl", class_="stats") if self._meta else None
+
+    @cached_property
+    def _stat_texts(self) -> Dict[str, str]:
+        """The texts of the stats block's `dd` elements, keyed by their class, gathered in a single pass."""
+        texts = {}
+        if self._stats:
+            for element in self._stats.find_all("dd", recursive=False):
+                classes = element.get("class")
+                if classes:
+                    texts[classes[0]] = element.text.strip()
+        return texts
+
+    @cached_property
+    def _chapters(self) -> Tuple[str, Optional[str]]:
+        """The published and expected parts of the chapter count, e.g. `("5", "10")` for "5/10"."""
+        chapters_text = self._get_stat("chapters")
+        if "/" in chapters_text:
+            published, expected = chapters_text.split("/", 1)
+            return published.strip(), expected.strip()
+        return chapters_text, None
+
+    @staticmethod
+    def _get_detail(parent: Optional[Tag], name: str) -> str:
+        """Extract the text of the `dd.<name>` element within the given block."""
+        element = parent.find("dd", class_=name) if parent else None
+        return element.text.strip() if element else ""
+
+    def _get_stat(self, name: str) -> str:
+        """Extract the text of the `dd.<name>` element within the stats block."""
+        return self._stat_texts.get(name, "")
+
+    def _get_tags(self, name: str, intern: bool = False) -> List[str]:
+        """Extract the tags listed under the `dd.<name>` element of the work's metadata.
+
+        Parameters
+        -----------
+        intern: :class:`bool`
+            Whether to intern the tags, so works sharing a tag share one string.
+            Only meant for tags drawn from AO3's small, fixed sets (ratings, warnings, categories):
+            interned strings may never be freed (they're immortal as of CPython 3.12).
+        """
+        element = self._meta.find("dd", class_=name) if self._meta else None
+        if not element:
+            return []
+        tags = [tag.text.strip() for tag in element.find_all("a")]
+        return [sys.intern(tag) for tag in tags] if intern else tags
+
     def _fetch_title(self) -> str:
         """Extract the work title from the page."""
-        return self._get_text("h2.title")
+        return self._get_text(_SEL_TITLE)
 
     def _fetch_authors(self) -> str:
         """Extract the work author(s) from the page."""
-        authors = self._get_texts("a[rel='author']")
-        return ", ".join(authors) if authors else "Anonymous"
+        return ", ".join(self._iter_texts(_SEL_AUTHORS)) or "Anonymous"
 
     def _fetch_summary(self) -> Optional[str]:
         """Extract the work summary."""
-        summary_div = self.soup.select_one("div.summary .userstuff")
+        summary_div = self._soup.select_one(_SEL_SUMMARY)
         if not summary_div:
             return None
         return summary_div.text.strip()
 
     def _fetch_language(self) -> str:
         """Extract the work language."""
-        language_text = self._get_text("dd.language")
-        return language_text
+        language_text = self._get_detail(self._meta, "language")
+        # One of AO3's fixed set of languages, so it's interned like the ratings and warnings.
+        return sys.intern(language_text)
 
     def _fetch_word_count(self) -> int:
         """Extract the work word count."""
-        words_text = self._get_text("dd.words")
+        words_text = self._get_stat("words")
         return self._extract_count(words_text)
 
     def _fetch_chapters_published(self) -> int:
         """Extract the number of published chapters."""
-        chapters_text = self._get_text("dd.chapters")
-        if "/" in chapters_text:
-            published = chapters_text.split("/")[0].strip()
+        published, expected = self._chapters
+        if expected is not None:
             return self._extract_count(published)
         return 1
 
     def _fetch_chapters_expected(self) -> Optional[int]:
         """Extract the expected total number of chapters."""
-        chapters_text = self._get_text("dd.chapters")
-        if "/" in chapters_text:
-            expected = chapters_text.split("/")[1].strip()
-            if expected.lower() == "?" or expected.lower() == "∞":
+        _, expected = self._chapters
+        if expected is not None:
+            if expected in _UNKNOWN_CHAPTER_COUNTS:
                 return None
             return self._extract_count(expected)
         return None
 
     def _fetch_is_completed(self) -> bool:
         """Determine if the work is marked as complete."""
-        chapters_text = self._get_text("dd.chapters")
-        if "/" in chapters_text:
-            published, expected = chapters_text.split("/")
+        published, expected = self._chapters
+        if expected is not None:
             # Work is complete if published chapters equals expected chapters
             # or if single chapter work
-            if published.strip() == expected.strip() and expected.strip() != "?":
+            if published == expected and expected != "?":
                 return True
-        return "complete" in self._get_text("dl.stats").lower()
+        return self._stats is not None and "complete" in self._stats.text.lower()
 
     def _fetch_kudos(self) -> int:
         """Extract the number of kudos."""
-        kudos_text = self._get_text("dd.kudos")
+        kudos_text = self._get_stat("kudos")
         return self._extract_count(kudos_text)
 
     def _fetch_comments(self) -> int:
         """Extract the number of comments."""
-        comments_text = self._get_text("dd.comments")
+        comments_text = self._get_stat("comments")
         return self._extract_count(comments_text)
 
     def _fetch_bookmarks(self) -> int:
         """Extract the number of bookmarks."""
-        bookmarks_text = self._get_text("dd.bookmarks")
+        bookmarks_text = self._get_stat("bookmarks")
         return self._extract_count(bookmarks_text)
 
     def _fetch_hits(self) -> int:
         """Extract the number of hits."""
-        hits_text = self._get_text("dd.hits")
+        hits_text = self._get_stat("hits")
         return self._extract_count(hits_text)
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse a date string into a datetime object."""
-        if not date_str:
+        date_str = date_str.strip() if date_str else ""
+        # AO3 date format is typically: YYYY-MM-DD
+        # Being fixed-width, it's sliced directly rather than going through `strptime`.
+        if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
             return None
         try:
-            # AO3 date format is typically: YYYY-MM-DD
-            return datetime.strptime(date_str.strip(), "%Y-%m-%d")
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
         except ValueError:
             return None
 
     def _fetch_published_date(self) -> Optional[datetime]:
         """Extract the publication date."""
-        date_text = self._get_text("dd.published")
+        date_text = self._get_stat("published")
         return self._parse_date(date_text)
 
     def _fetch_updated_date(self) -> Optional[datetime]:
         """Extract the last updated date."""
-        date_text = self._get_text("dd.status")
+        date_text = self._get_stat("status")
         return self._parse_date(date_text)
 
     def _fetch_tags(self) -> List[str]:
         """Extract additional/freeform tags."""
-        return self._get_texts("dd.freeform ul.commas li a")
+        return self._get_tags("freeform")
 
     def _fetch_relationships(self) -> List[Tuple[str, str]]:
         """Extract character relationships in the work.
@@ -146,73 +235,67 @@ class WorkParser(Base):
         List[Tuple[:class:`str`, :class:`str`]]
             List of character relationship tuples
         """
-        rel_tags = self._get_texts("dd.relationship ul.commas li a")
         relationships = []
 
-        for tag in rel_tags:
-            if "/" in tag:
-                parts = tag.split("/", 1)  # Split only on first occurrence
-                relationships.append((parts[0].strip(), parts[1].strip()))
+        for tag in self._get_tags("relationship"):
+            # Split only on first occurrence
+            first, separator, second = tag.partition("/")
             # Handle platonic relationships (&)
-            elif "&" in tag:
-                parts = tag.split("&", 1)  # Split only on first occurrence
-                relationships.append((parts[0].strip(), parts[1].strip()))
-            else:
-                # If no relationship separator is found, use empty string as second element
-                relationships.append((tag, ""))
+            if not separator:
+                first, separator, second = tag.partition("&")
+            # If no relationship separator is found, `second` is left as an empty string
+            relationships.append((first.strip(), second.strip()))
 
         return relationships
 
     def _fetch_characters(self) -> List[str]:
         """Extract character tags."""
-        return self._get_texts("dd.character ul.commas li a")
+        return self._get_tags("character")
 
     def _fetch_fandoms(self) -> List[str]:
         """Extract fandom tags."""
-        return self._get_texts("dd.fandom ul.commas li a")
+        return self._get_tags("fandom")
 
     def _fetch_categories(self) -> List[str]:
         """Extract category tags."""
-        return self._get_texts("dd.category ul.commas li a")
+        return self._get_tags("category", intern=True)
 
     def _fetch_ratings(self) -> List[str]:
         """Extract rating tags."""
-        return self._get_texts("dd.rating ul.commas li a")
+        return self._get_tags("rating", intern=True)
 
     def _fetch_warnings(self) -> List[str]:
         """Extract warning tags."""
-        return self._get_texts("dd.warning ul.commas li a")
+        return self._get_tags("warning", intern=True)
 
     def _fetch_series(self) -> Optional[str]:
         """Extract series information if present."""
-        position_span = self.soup.select_one("dd.series span.position")
+        position_span = self._soup.select_one(_SEL_SERIES_POSITION)
         if position_span:
-            series_link = position_span.select_one("a")
+            series_link = position_span.find("a")
             if series_link:
                 return series_link.text.strip()
 
         # Fallback: try other potential selectors
-        series_element = self.soup.select_one("dd.series a:not(.previous):not(.next)")
+        series_element = self._soup.select_one(_SEL_SERIES_LINK)
         if series_element:
             return series_element.text.strip()
 
         return None
 
-    def _fetch_is_restricted(self) -> bool:
-        """Determine if the work has restricted access."""
-        # Check for common indicators of restricted content
-        warnings = self._fetch_warnings()
-        restricted_indicators = ["restricted", "explicit", "mature", "not rated"]
+    def _fetch_is_restricted(self, warnings: Optional[List[str]] = None) -> bool:
+        """Determine if the work has restricted access.
 
-        title_class = self._get_attribute("h2.title", "class", "")
+        Parameters
+        -----------
+        warnings: Optional[List[:class:`str`]]
+            The work's warnings, if already extracted.
+        """
+        title_class = self._get_attribute(_SEL_TITLE, "class", "")
         if "restricted" in title_class:
             return True
 
-        for warning in warnings:
-            if any(
-                indicator.lower() in warning.lower()
-                for indicator in restricted_indicators
-            ):
-                return True
-
-        return False
+        # Check for common indicators of restricted content
+        if warnings is None:
+            warnings = self._fetch_warnings()
+        return any(_RESTRICTED_RE.search(warning) for warning in warnings)
@@ -4,8 +4,8 @@ Module for handling search functionality within Archive Of Our Own.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Generic, TypeVar, Any, Literal
+from dataclasses import dataclass, fields
+from typing import ClassVar, Generic, TypeVar, Any, Literal
 
 from ao3.client import Session
 
@@ -30,15 +30,16 @@ class Result(Generic[T]):
     parameters: dict[str, Any]
     results: list[T]
 
+    _FIELDS: ClassVar[frozenset[str]]
+    """Names of the dataclass' fields; the only keys `update` assigns."""
+
     def update(self, data: dict[str, Any]) -> None:
         for k, v in data.items():
-            try:
-                if hasattr(self, k):
-                    setattr(self, k, v)
-            except Exception as e:
-                raise ValueError(
-                    f"Invalid data parameter for {self.__class__.__name__}: {e}"
-                )
+            if k in self._FIELDS:
+                setattr(self, k, v)
+
+
+Result._FIELDS = frozenset(field.name for field in fields(Result))
 
 
 class ArchiveSearch:
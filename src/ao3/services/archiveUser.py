@@ -4,8 +4,8 @@ Module for handling search functionality within Archive Of Our Own.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Any
+from dataclasses import dataclass, field, fields
+from typing import ClassVar, Optional, Any
 
 from ao3.client import Session
 from ao3.services.archiveWorks import ArchiveWork
@@ -27,10 +27,11 @@ class UserNotFoundError(UserError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMetadata:
     name: str
-    link: str
+    link: Optional[str] = None
+    """Set for pseudonyms; otherwise left unset, and derived from `name` by `ArchiveUser.link`."""
     id: Optional[str] = None
 
     bio: str = ""
@@ -38,43 +39,32 @@ class UserMetadata:
     joined_at: Optional[str] = None
     email: Optional[str] = None
 
-    works: list[ArchiveWork] = None
-    bookmarks: list[ArchiveWork] = None
-    series: dict[str, list[ArchiveWork]] = None  # TODO: Implement Series model
+    works: list[ArchiveWork] = field(default_factory=list)
+    bookmarks: list[ArchiveWork] = field(default_factory=list)
+    series: dict[str, list[ArchiveWork]] = field(
+        default_factory=dict
+    )  # TODO: Implement Series model
 
-    collections: list[str] = (
-        None  # Unsupported, could be implemented in the future as a model
-    )
-    fandoms: list[str] = None
+    collections: list[str] = field(
+        default_factory=list
+    )  # Unsupported, could be implemented in the future as a model
+    fandoms: list[str] = field(default_factory=list)
 
-    pseudonyms: list[ArchiveUser] = None
+    pseudonyms: list[ArchiveUser] = field(default_factory=list)
     is_pseudonym: bool = False
     parent: Optional[ArchiveUser] = None
 
-    def __post_init__(self):
-        """Initialize default values for mutable collections."""
-        if self.pseudonyms is None:
-            self.pseudonyms = []
-        if self.works is None:
-            self.works = []
-        if self.bookmarks is None:
-            self.bookmarks = []
-        if self.series is None:
-            self.series = {}
-        if self.collections is None:
-            self.collections = []
-        if self.fandoms is None:
-            self.fandoms = []
+    _FIELDS: ClassVar[frozenset[str]]
+    """Names of the dataclass' fields; the only keys `update` assigns."""
 
     def update(self, data: dict[str, Any]) -> None:
-        for k, v in data.items():
-            try:
-                if hasattr(self, k):
-                    setattr(self, k, v)
-            except Exception as e:
-                raise ValueError(
-                    f"Invalid data parameter for {self.__class__.__name__}: {e}"
-                )
+        for k in data.keys() & self._FIELDS:
+            setattr(self, k, data[k])
+
+
+UserMetadata._FIELDS = frozenset(f.name for f in fields(UserMetadata))
+
+_USERS_URL = "https://archiveofourown.org/users/"
 
 
 class ArchiveUser:
@@ -91,28 +81,36 @@ class ArchiveUser:
         load (bool, optional): Whether to load the user data immediately. Defaults to False.
     """
 
+    __slots__ = ("_session", "_is_loaded", "_data")
+
     def __init__(
         self,
         name: str,
         parent: Optional[UserMetadata] = None,
         load: bool = False,
     ) -> None:
-        self._session = Session.instance()
+        self._session: Optional[Session] = None
         self._is_loaded = False
-        self._data = UserMetadata(
-            name=name, link=f"https://archiveofourown.org/users/{name}/profile"
-        )
+        self._data = UserMetadata(name=name)
         if parent:
             self._build_pseudonym_relationship(name, parent)
 
         if load:
             self.reload()
 
+    def _get_session(self) -> Session:
+        """
+        Shortcut to the client session, only acquired once it's needed.
+        """
+        if self._session is None:
+            self._session = Session.instance()
+        return self._session
+
     def _resolve_url(self, url: str) -> str:
         """
         Shortcut method from the client to resolve a URL.
         """
-        return self._session._resolve_url(url)
+        return self._get_session()._resolve_url(url)
 
     def _build_pseudonym_relationship(
         self,
@@ -126,11 +124,8 @@ class ArchiveUser:
                 "parent": parent,
             }
         )
-        parent.update(
-            {
-                "pseudonyms": parent.pseudonyms + [self],
-            }
-        )
+        # Appended in place, rather than rebuilding the list for each pseudonym added.
+        parent.pseudonyms.append(self)
 
     def reload(self) -> None:
         """Reload the user's metadata."""
@@ -154,7 +149,8 @@ class ArchiveUser:
 
     @property
     def link(self) -> str:
-        return self._data.link
+        # The profile link is only built when asked for, rather than for every user (or pseudonym) created.
+        return self._data.link or _USERS_URL + self._data.name + "/profile"
 
     @property
     def id(self) -> Optional[str]:
@@ -4,14 +4,17 @@ Module for models representing works within Archive Of Our Own.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, Any
+from typing import TYPE_CHECKING, ClassVar, Iterable, Optional, Any
 
 from ao3.client import Session
 from ao3.parsers import WorkParser
 
-__all__ = ["ArchiveWork"]
+__all__ = ["ArchiveWork", "WorkStatsTable"]
 
 
 class WorkError(Exception):
@@ -38,10 +41,13 @@ class WorkRestrictedError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkMetadata:
     """
     Model representing the metadata of a work within AO3.
+
+    Frozen, since loaded metadata is shared through the cache by every instance of the same work;
+    reloading a work replaces its metadata rather than modifying it. The lists it holds are still mutable.
     """
 
     ID: str
@@ -64,43 +70,54 @@ class WorkMetadata:
     published: Optional[datetime] = None
     updated: Optional[datetime] = None
 
-    tags: list[str] = None
-    relationships: list[tuple[str, str]] = None
-    characters: list[str] = None
-    fandoms: list[str] = None
-    categories: list[str] = None
-    ratings: list[str] = None
-    warnings: list[str] = None
+    tags: list[str] = field(default_factory=list)
+    relationships: list[tuple[str, str]] = field(default_factory=list)
+    characters: list[str] = field(default_factory=list)
+    fandoms: list[str] = field(default_factory=list)
+    categories: list[str] = field(default_factory=list)
+    ratings: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
 
     series: Optional[str] = None
     is_restricted: bool = False
 
-    def __post_init__(self):
-        """Initialize default values for the dataclass."""
-        if self.tags is None:
-            self.tags = []
-        if self.relationships is None:
-            self.relationships = []
-        if self.characters is None:
-            self.characters = []
-        if self.fandoms is None:
-            self.fandoms = []
-        if self.categories is None:
-            self.categories = []
-        if self.ratings is None:
-            self.ratings = []
-        if self.warnings is None:
-            self.warnings = []
-
-    def update(self, data: dict[str, Any]) -> None:
-        for k, v in data.items():
-            try:
-                if hasattr(self, k):
-                    setattr(self, k, v)
-            except Exception as e:
-                raise ValueError(
-                    f"Invalid data parameter for {self.__class__.__name__}: {e}"
-                )
+    _FIELDS: ClassVar[frozenset[str]]
+    """Names of the dataclass' fields; the only keys `from_dictionary` reads."""
+
+    @classmethod
+    def from_dictionary(cls, data: dict[str, Any]) -> WorkMetadata:
+        """Create the metadata from a dictionary (e.g. as returned by `WorkParser`), ignoring unknown keys."""
+        return cls(**{k: data[k] for k in data.keys() & cls._FIELDS})
+
+
+WorkMetadata._FIELDS = frozenset(f.name for f in fields(WorkMetadata))
+
+
+_WORKS_URL = "https://archiveofourown.org/works/"
+
+_WORK_CACHE: OrderedDict[str, WorkMetadata] = OrderedDict()
+"""Metadata of the most recently loaded works, keyed by ID, from least to most recently used."""
+_WORK_CACHE_MAX = 4096
+"""Maximum number of works kept in `_WORK_CACHE`."""
+_WORK_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached_work(work_id: str) -> Optional[WorkMetadata]:
+    """Return the cached metadata of the given work, if any, marking it as most recently used."""
+    with _WORK_CACHE_LOCK:
+        data = _WORK_CACHE.get(work_id)
+        if data is not None:
+            _WORK_CACHE.move_to_end(work_id)
+        return data
+
+
+def _cache_work(work_id: str, data: WorkMetadata) -> None:
+    """Cache the metadata of the given work, evicting the least recently used one if full."""
+    with _WORK_CACHE_LOCK:
+        _WORK_CACHE[work_id] = data
+        _WORK_CACHE.move_to_end(work_id)
+        if len(_WORK_CACHE) > _WORK_CACHE_MAX:
+            _WORK_CACHE.popitem(last=False)
 
 
 class ArchiveWork:
@@ -110,153 +127,218 @@ class ArchiveWork:
     This class provides methods for retrieving and accessing work metadata,
     including title, author, statistics, and tags.
 
+    Every field of `WorkMetadata` (e.g. `title`, `kudos`, `tags`) is readable as an attribute,
+    and loads the work's metadata on first access.
+
     Args:
-        work_id (str): The ID of the work.
+        work_id (str | int): The ID of the work.
         load (bool, optional): If the work metadata should be loaded upon initialization. Defaults to False.
     """
 
+    __slots__ = ("_session", "_id", "_data", "_loaded")
+
+    if TYPE_CHECKING:
+        # The metadata fields served by `__getattr__`, declared for type checkers and IDEs.
+        # `ID` and `link` are properties, as neither requires loading the work.
+        title: str
+        author: str
+        summary: Optional[str]
+        language: str
+        words: int
+        chapters_published: int
+        chapters_expected: Optional[int]
+        is_completed: bool
+        kudos: int
+        comments: int
+        bookmarks: int
+        hits: int
+        published: Optional[datetime]
+        updated: Optional[datetime]
+        tags: list[str]
+        relationships: list[tuple[str, str]]
+        characters: list[str]
+        fandoms: list[str]
+        categories: list[str]
+        ratings: list[str]
+        warnings: list[str]
+        series: Optional[str]
+        is_restricted: bool
+
     def __init__(
         self,
-        work_id: str,
+        work_id: str | int,
         load: bool = False,
     ) -> None:
-        self._session = Session.instance()
-        self._id = work_id
-        self._data = WorkMetadata(
-            ID=work_id, link=f"https://archiveofourown.org/works/{work_id}"
-        )
+        self._session: Optional[Session] = None
+        # Kept as a string, so the link, the cache's keys and `id` agree whether the ID was given as a string or an integer.
+        self._id = str(work_id)
+        # The link is derived from the ID when asked for (see `link`), so it isn't built for works never fetched.
+        self._data = WorkMetadata(ID=self._id)
         self._loaded = False
 
         if load:
-            self.reload()
+            self._ensure_loaded()
+
+    @classmethod
+    def load_many(
+        cls,
+        work_ids: Iterable[str | int],
+        max_concurrency: int = 4,
+    ) -> list[ArchiveWork]:
+        """
+        Create and load several works at once.
+
+        Works already cached are loaded from the cache; the pages of the others are fetched concurrently
+        (see `ClientSession.fetch_many`), rather than one after the other as loading each work individually would.
+        A work whose ID is given more than once is only fetched once.
+        The first page is fetched before the others, as concurrent requests are only safe
+        once the session has passed Cloudflare's challenge.
+
+        If some pages fail to load, the others are still loaded (and cached) before the first error is raised.
+
+        Args:
+            work_ids (Iterable[str | int]): The IDs of the works.
+            max_concurrency (int, optional): The maximum number of requests in flight at once. Defaults to 4.
+
+        Returns:
+            list[ArchiveWork]: The loaded works, in the same order as `work_ids`.
+        """
+        works = [cls(work_id) for work_id in work_ids]
+        missing: dict[str, list[ArchiveWork]] = {}
+        for work in works:
+            if not work._load_from_cache():
+                missing.setdefault(work.id, []).append(work)
+
+        pending = list(missing.values())
+        links = [duplicates[0].link for duplicates in pending]
+        session = Session.instance()
+        # The first page is fetched on its own, so that on a fresh session, Cloudflare's challenge is solved
+        # (and its clearance cookie set) before any requests run concurrently.
+        pages = session.fetch_many(links[:1], max_concurrency=1, return_exceptions=True)
+        pages += session.fetch_many(
+            links[1:], max_concurrency=max_concurrency, return_exceptions=True
+        )
+        error: Optional[Exception] = None
+        for (work, *duplicates), page in zip(pending, pages):
+            if isinstance(page, Exception):
+                error = error or page
+                continue
+            work._load(page)
+            # The parsed metadata is shared, just as it would be through the cache.
+            for duplicate in duplicates:
+                duplicate._data = work._data
+                duplicate._loaded = True
+
+        if error is not None:
+            raise error
+        return works
+
+    def _get_session(self) -> Session:
+        """Return the client session, acquiring it on first use."""
+        if self._session is None:
+            self._session = Session.instance()
+        return self._session
 
     def reload(self) -> None:
         """Reload the work metadata."""
+        # Fetched as text, so `WorkParser` only builds a tree for the parts of the page it reads.
+        self._load(self._get_session().fetch(self.link))
+
+    def _load(self, page: str) -> None:
+        """Load the work metadata from its fetched page."""
+        parser = WorkParser(page)
+        # A new object, as metadata is frozen (and the previous one may be shared with other instances through the cache).
+        self._data = WorkMetadata.from_dictionary(
+            {"ID": self._id, "link": self.link, **parser.parse()}
+        )
+        self._loaded = True
+        _cache_work(self._id, self._data)
+
+    def _load_from_cache(self) -> bool:
+        """Load the work metadata from the cache, returning whether it was there."""
+        data = _get_cached_work(self._id)
+        if data is None:
+            return False
+        self._data = data
         self._loaded = True
-        response = self._session.fetch(self._data.link, soup=True)
-        parser = WorkParser(response)
-        self._data.update(parser.parse())
+        return True
 
     def _ensure_loaded(self) -> None:
-        if not self._loaded:
+        # Unlike an explicit `reload`, a first load is served from the cache when possible.
+        if not self._loaded and not self._load_from_cache():
             self.reload()
 
     @property
-    def title(self) -> str:
-        """Return the title of the work."""
-        self._ensure_loaded()
-        return self._data.title
+    def id(self) -> str:
+        """Return the ID of the work."""
+        return self._id
 
     @property
-    def author(self) -> str:
-        """Return the author of the work."""
-        self._ensure_loaded()
-        return self._data.author
+    def ID(self) -> str:
+        """Return the ID of the work, as `WorkMetadata.ID`; like `id`, it doesn't require loading the work."""
+        return self._id
 
     @property
     def link(self) -> str:
-        """Return the link to the work."""
-        self._ensure_loaded()
-        return self._data.link
-
-    @property
-    def summary(self) -> Optional[str]:
-        """Return the summary of the work."""
-        self._ensure_loaded()
-        return self._data.summary
-
-    @property
-    def language(self) -> str:
-        """Return the language of the work."""
-        self._ensure_loaded()
-        return self._data.language
-
-    @property
-    def words(self) -> int:
-        """Return the word count of the work."""
-        self._ensure_loaded()
-        return self._data.words
-
-    @property
-    def chapters_published(self) -> int:
-        """Return the number of chapters published."""
-        self._ensure_loaded()
-        return self._data.chapters_published
-
-    @property
-    def chapters_expected(self) -> Optional[int]:
-        """Return the expected number of chapters."""
-        self._ensure_loaded()
-        return self._data.chapters_expected
-
-    @property
-    def is_completed(self) -> bool:
-        """Return whether the work is completed."""
-        self._ensure_loaded()
-        return self._data.is_completed
-
-    @property
-    def kudos(self) -> int:
-        """Return the number of kudos."""
-        self._ensure_loaded()
-        return self._data.kudos
-
-    @property
-    def comments(self) -> int:
-        """Return the number of comments."""
-        self._ensure_loaded()
-        return self._data.comments
-
-    @property
-    def bookmarks(self) -> int:
-        """Return the number of bookmarks."""
-        self._ensure_loaded()
-        return self._data.bookmarks
-
-    @property
-    def hits(self) -> int:
-        """Return the number of hits."""
-        self._ensure_loaded()
-        return self._data.hits
-
-    @property
-    def published(self) -> Optional[datetime]:
-        """Return the date the work was published."""
-        self._ensure_loaded()
-        return self._data.published
+        """Return the link to the work; unlike the other metadata, it doesn't require loading the work."""
+        return _WORKS_URL + self._id
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not found on the instance or class, i.e. the metadata fields.
+        if name in WorkMetadata._FIELDS:
+            self._ensure_loaded()
+            return getattr(self._data, name)
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
 
-    @property
-    def updated(self) -> Optional[datetime]:
-        """Return the date the work was updated."""
-        self._ensure_loaded()
-        return self._data.updated
+    def __dir__(self) -> Iterable[str]:
+        # The metadata fields aren't attributes of the class, so they're listed explicitly.
+        return {*super().__dir__(), *WorkMetadata._FIELDS}
 
-    @property
-    def tags(self) -> list[str]:
-        """Return the tags of the work."""
-        self._ensure_loaded()
-        return self._data.tags
 
-    @property
-    def relationships(self) -> list[tuple[str, str]]:
-        """Return the relationships of the work."""
-        self._ensure_loaded()
-        return self._data.relationships
+@dataclass(slots=True)
+class WorkStatsTable:
+    """
+    Columnar view of the numeric stats of several works, one row per work.
 
-    @property
-    def characters(self) -> list[str]:
-        """Return the characters of the work."""
-        self._ensure_loaded()
-        return self._data.characters
+    Each stat is kept in its own packed array of 64-bit integers, rather than as an attribute of every work.
+    Iterating over a column from Python (e.g. `sum(table.kudos)`) is no faster than over a list;
+    the arrays expose their buffer instead, so they can be viewed without copying for vectorized work,
+    e.g. `numpy.frombuffer(table.kudos, dtype="int64")`.
 
-    @property
-    def fandoms(self) -> list[str]:
-        """Return the fandoms of the work."""
-        self._ensure_loaded()
-        return self._data.fandoms
+    Chapter counts aren't included, as the expected count of a work may be unknown.
+    """
 
-    @property
-    def ratings(self) -> list[str]:
-        """Return the ratings of the work."""
-        self._ensure_loaded()
-        return self._data.ratings
+    ids: list[str] = field(default_factory=list)
+    words: array = field(default_factory=lambda: array("q"))
+    kudos: array = field(default_factory=lambda: array("q"))
+    comments: array = field(default_factory=lambda: array("q"))
+    bookmarks: array = field(default_factory=lambda: array("q"))
+    hits: array = field(default_factory=lambda: array("q"))
+
+    @classmethod
+    def from_works(cls, works: Iterable[ArchiveWork]) -> WorkStatsTable:
+        """
+        Build the table from the given works, loading those that aren't yet.
+
+        Args:
+            works (Iterable[ArchiveWork]): The works, e.g. as returned by `ArchiveWork.load_many`.
+
+        Returns:
+            WorkStatsTable: The table, with the rows in the same order as `works`.
+        """
+        table = cls()
+        for work in works:
+            work._ensure_loaded()
+            data = work._data
+            table.ids.append(work.id)
+            table.words.append(data.words)
+            table.kudos.append(data.kudos)
+            table.comments.append(data.comments)
+            table.bookmarks.append(data.bookmarks)
+            table.hits.append(data.hits)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.ids)